@@ -65,6 +65,11 @@ class WebackVacuumCamera(Camera):
         # self._attr_supported_features = ()
         _LOGGER.info(f"Vacuum Camera initialized: {self.name}")
 
+    async def async_added_to_hass(self):
+        """Render a first map image once the camera is added"""
+        await super().async_added_to_hass()
+        await self._vacdevice.render_map()
+
     @property
     def name(self):
         """Return the name of the device."""
@@ -2,15 +2,35 @@
 VacDevice Module
 """
 
+import asyncio
 import io
 import logging
 
+from PIL import Image
+
 from .vacmap import VacMap, VacMapDraw
 from .webackapi import WebackWssCtrl
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _encode_png(img):
+    """Encode PIL image to PNG bytes (blocking, run it in an executor)"""
+    if img.mode != "P":
+        # Map only uses a handful of colors, a palette image is lossless here
+        # and much cheaper to encode than RGBA
+        rgba_img = img
+        img = rgba_img.quantize(colors=16, method=Image.Quantize.FASTOCTREE)
+        rgba_img.close()
+
+    img_byte_arr = io.BytesIO()
+    img.save(img_byte_arr, format="PNG", compress_level=1, optimize=False)
+    img.close()
+    # getvalue() hands over BytesIO's internal bytes object without copying it
+    # as long as no buffer view is exported, so keep plain bytes for the camera
+    return img_byte_arr.getvalue()
+
+
 class VacDevice(WebackWssCtrl):
     """
     VacDevice Class
@@ -38,10 +58,23 @@ class VacDevice(WebackWssCtrl):
         self.map = None
         self.map_image_buffer = None
         self.map_camera = None
+        self._map_render_key = None
+        self._current_mode = self.IDLE_MODE
+        self._is_cleaning = False
+        self._is_charging = False
+        # Payloads of simple commands never change, build them once
+        self._simple_cmds = {
+            "on": {self.ASK_STATUS: self.CLEAN_MODE_AUTO},
+            "off": {self.ASK_STATUS: self.CHARGE_MODE_RETURNING},
+            "pause": {self.ASK_STATUS: self.CLEAN_MODE_STOP},
+            "spot": {self.ASK_STATUS: self.CLEAN_MODE_SPOT},
+            "locate": {self.ASK_STATUS: self.ROBOT_LOCATION_SOUND},
+            "base": {self.ASK_STATUS: self.CHARGE_MODE_RETURNING},
+        }
 
         # First init status from HTTP API
         if self.robot_status is None:
-            self.robot_status = thing_status
+            self.set_robot_status(thing_status)
 
     # ==========================================================
     # Update controller
@@ -69,38 +102,60 @@ class VacDevice(WebackWssCtrl):
         )
         if map_data:
             self.map = VacMap(map_data)
-            self.render_map()
+            await self.render_map()
 
-    def render_map(self):
+    async def render_map(self):
         """Rendering Map"""
         if not self.map:
             return False
 
+        # Nothing consumes the image until a camera is registered
+        if self.map_camera is None:
+            return False
+
+        # Skip rendering if nothing that is drawn has changed since last render
+        map_data = self.map.data
+        render_key = (
+            map_data["MapData"],
+            map_data["MapWidth"],
+            map_data["MapHigh"],
+            map_data["MapResolution"],
+            tuple(map_data["MapOrigin"]),
+            tuple(map_data["ChargerPoint"]),
+            map_data.get("PointData"),
+            map_data.get("PointType"),
+        )
+        if render_key == self._map_render_key and self.map_image_buffer is not None:
+            return True
+
         vac_map_draw = VacMapDraw(self.map)
         vac_map_draw.draw_charger_point()
         vac_map_draw.draw_path()
         vac_map_draw.draw_robot_position()
 
-        img = vac_map_draw.get_image()
-
-        img_byte_arr = io.BytesIO()
-        img.save(img_byte_arr, format="PNG")
-        img.close()
-        self.map_image_buffer = img_byte_arr.getvalue()
+        self.map_image_buffer = await asyncio.get_running_loop().run_in_executor(
+            None, _encode_png, vac_map_draw.get_image()
+        )
+        self._map_render_key = render_key
 
-        if self.map_camera is not None:
-            self.trigger_map_camera_update()
+        self.map_camera.schedule_update_ha_state(True)
 
         return True
 
     def register_map_camera(self, camera):
-        """Register map camera"""
+        """Register map camera, it must then call render_map() for a first image"""
         self.map_camera = camera
 
-    def trigger_map_camera_update(self):
-        """Trigger map camera update"""
-        if self.map_camera is not None:
-            self.map_camera.schedule_update_ha_state(True)
+    def set_robot_status(self, status):
+        """Store a new robot status and cache the values derived from it"""
+        # Called from the websocket thread: derive everything before publishing
+        current_mode = status.get("working_status", self.IDLE_MODE)
+        is_cleaning = current_mode in self.CLEANING_STATES
+        is_charging = current_mode in self.CHARGING_STATES
+        self._current_mode = current_mode
+        self._is_cleaning = is_cleaning
+        self._is_charging = is_charging
+        super().set_robot_status(status)
 
     # ==========================================================
     # Vacuum Entity
@@ -109,21 +164,17 @@ class VacDevice(WebackWssCtrl):
     @property
     def current_mode(self):
         """Raw working_status field string"""
-        if "working_status" in self.robot_status:
-            return self.robot_status["working_status"]
-        return self.IDLE_MODE
+        return self._current_mode
 
     @property
     def raw_status(self) -> str:
         """Raw thing_status JSON"""
-        _LOGGER.debug("raw_status %s", self.robot_status)
         return self.robot_status
 
     @property
     def is_cleaning(self) -> bool:
         """Boolean define if robot is in cleaning state"""
-        _LOGGER.debug("is_cleaning = %s ", self.current_mode)
-        return self.current_mode in self.CLEANING_STATES
+        return self._is_cleaning
 
     @property
     def is_available(self):
@@ -134,35 +185,28 @@ class VacDevice(WebackWssCtrl):
     @property
     def is_charging(self):
         """Boolean define if robot is charging"""
-        return self.current_mode in self.CHARGING_STATES
+        return self._is_charging
 
     @property
     def error_info(self):
         """Raw error_info field string"""
-        if "error_info" in self.robot_status:
-            return self.robot_status["error_info"]
-        return None
+        return self.robot_status.get("error_info")
 
     @property
     def battery_level(self):
         """Raw battery_level field integer"""
-        if "battery_level" in self.robot_status:
-            return int(self.robot_status["battery_level"])
-        return 0
+        battery_level = self.robot_status.get("battery_level")
+        return int(battery_level) if battery_level is not None else 0
 
     @property
     def fan_status(self):
         """Raw fan_status field string"""
-        if "fan_status" in self.robot_status:
-            return self.robot_status["fan_status"]
-        return None
+        return self.robot_status.get("fan_status")
 
     @property
     def mop_status(self):
         """Raw fan_status field string"""
-        if "water_level" in self.robot_status:
-            return self.robot_status["water_level"]
-        return None
+        return self.robot_status.get("water_level")
 
     @property
     def fan_speed_list(self):
@@ -177,25 +221,20 @@ class VacDevice(WebackWssCtrl):
     @property
     def clean_time(self):
         """Return clean time"""
-        if "clean_time" in self.robot_status:
-            return self.robot_status["clean_time"]
-        return 0
+        return self.robot_status.get("clean_time", 0)
 
     @property
     def clean_area(self):
         """Return clean area in square meter"""
-        if "clean_area" in self.robot_status:
-            return self.robot_status["clean_area"]
-        return 0
+        return self.robot_status.get("clean_area", 0)
 
     @property
     def vacuum_or_mop(self) -> int:
         """Find if the robot is in vacuum or mop mode"""
-        if "fan_status" and "water_level" in self.robot_status:
-            if (
-                self.robot_status["fan_status"] == self.FAN_DISABLED
-                and self.robot_status["water_level"] != self.MOP_DISABLED
-            ):
+        fan_status = self.robot_status.get("fan_status")
+        water_level = self.robot_status.get("water_level")
+        if fan_status is not None and water_level is not None:
+            if fan_status == self.FAN_DISABLED and water_level != self.MOP_DISABLED:
                 return self.MOP_ON
             return self.VACUUM_ON
         return self.NO_FAN_NO_MOP
@@ -222,41 +261,33 @@ class VacDevice(WebackWssCtrl):
         await self.send_command(self.name, self.sub_type, working_payload)
         return
 
+    async def _cmd(self, key):
+        """Send a simple working status command"""
+        await self.send_command(self.name, self.sub_type, self._simple_cmds[key])
+
     async def turn_on(self):
         """Turn ON vacuum"""
-        working_payload = {self.ASK_STATUS: self.CLEAN_MODE_AUTO}
-        await self.send_command(self.name, self.sub_type, working_payload)
-        return
+        return await self._cmd("on")
 
     async def turn_off(self):
         """Turn OFF vacuum"""
-        working_payload = {self.ASK_STATUS: self.CHARGE_MODE_RETURNING}
-        await self.send_command(self.name, self.sub_type, working_payload)
-        return
+        return await self._cmd("off")
 
     async def pause(self):
         """Pause vacuum"""
-        working_payload = {self.ASK_STATUS: self.CLEAN_MODE_STOP}
-        await self.send_command(self.name, self.sub_type, working_payload)
-        return
+        return await self._cmd("pause")
 
     async def clean_spot(self):
         """Clean spot command"""
-        working_payload = {self.ASK_STATUS: self.CLEAN_MODE_SPOT}
-        await self.send_command(self.name, self.sub_type, working_payload)
-        return
+        return await self._cmd("spot")
 
     async def locate(self):
         """Locate vacuum"""
-        working_payload = {self.ASK_STATUS: self.ROBOT_LOCATION_SOUND}
-        await self.send_command(self.name, self.sub_type, working_payload)
-        return
+        return await self._cmd("locate")
 
     async def return_to_base(self):
         """Return to base command"""
-        working_payload = {self.ASK_STATUS: self.CHARGE_MODE_RETURNING}
-        await self.send_command(self.name, self.sub_type, working_payload)
-        return
+        return await self._cmd("base")
 
     async def goto(self, point: str):
         """GoTo point command"""
@@ -296,9 +327,7 @@ class VacDevice(WebackWssCtrl):
 
     async def clean_room(self, room_ids_list: list):
         """Clean room command"""
-        room_data = []
-        for room_id in room_ids_list:
-            room_data.append(dict(room_id=room_id))
+        room_data = [{"room_id": room_id} for room_id in room_ids_list]
         working_payload = {
             self.ASK_STATUS: self.CLEAN_MODE_ROOMS,
             self.SELECTED_ZONE: room_data,
@@ -311,15 +340,13 @@ class VacDevice(WebackWssCtrl):
         box_y = []
         num_boxes = len(bounding)
 
-        for box in bounding:
-            box_x.append(int(box[0] / 10))
-            box_x.append(int(box[0] / 10))
-            box_x.append(int(box[2] / 10))
-            box_x.append(int(box[2] / 10))
-            box_y.append(int(box[1] / 10))
-            box_y.append(int(box[3] / 10))
-            box_y.append(int(box[3] / 10))
-            box_y.append(int(box[1] / 10))
+        # Boxes are [x0, y0, x2, y2, (repeats)], each one is sent as 4 corners
+        for x_0, y_0, x_2, y_2 in (
+            (int(box[0] / 10), int(box[1] / 10), int(box[2] / 10), int(box[3] / 10))
+            for box in bounding
+        ):
+            box_x.extend((x_0, x_0, x_2, x_2))
+            box_y.extend((y_0, y_2, y_2, y_0))
 
         working_payload = {
             self.ASK_STATUS: self.ROBOT_PLANNING_RECT,
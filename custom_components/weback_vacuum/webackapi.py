@@ -343,7 +343,7 @@ class WebackWssCtrl(WebackApi):
     FAN_SPEED_HIGH = "Strong"
     FAN_SPEED_MAX = "Max"
 
-    FAN_SPEEDS = {FAN_SPEED_QUIET, FAN_SPEED_NORMAL, FAN_SPEED_HIGH}
+    FAN_SPEEDS = frozenset({FAN_SPEED_QUIET, FAN_SPEED_NORMAL, FAN_SPEED_HIGH})
 
     # MOP Water level
     MOP_DISABLED = "None"
@@ -351,7 +351,7 @@ class WebackWssCtrl(WebackApi):
     MOP_SPEED_NORMAL = "Default"
     MOP_SPEED_HIGH = "High"
 
-    MOP_SPEEDS = {MOP_SPEED_LOW, MOP_SPEED_NORMAL, MOP_SPEED_HIGH}
+    MOP_SPEEDS = frozenset({MOP_SPEED_LOW, MOP_SPEED_NORMAL, MOP_SPEED_HIGH})
 
     NO_FAN_NO_MOP = 0
     VACUUM_ON = 1
@@ -409,34 +409,40 @@ class WebackWssCtrl(WebackApi):
     ROBOT_ERROR_WALL_BLOCKED = "WallSensorBlocked"
     ROBOT_ERROR_VIR_WALL_FORB = "VirtualWallForbiddenZoneSettingError"
 
-    CLEANING_STATES = {
-        DIRECTION_CONTROL,
-        ROBOT_PLANNING_RECT,
-        RELOCATION,
-        CLEAN_MODE_Z,
-        CLEAN_MODE_AUTO,
-        CLEAN_MODE_EDGE,
-        CLEAN_MODE_EDGE_DETECT,
-        CLEAN_MODE_SPOT,
-        CLEAN_MODE_SINGLE_ROOM,
-        CLEAN_MODE_ROOMS,
-        CLEAN_MODE_MOP,
-        CLEAN_MODE_SMART,
-        CHARGE_MODE_RETURNING,
-    }
-
-    CHARGING_STATES = {
-        CHARGE_MODE_CHARGING,
-        CHARGE_MODE_DOCK_CHARGING,
-        CHARGE_MODE_DIRECT_CHARGING,
-    }
-
-    DOCKED_STATES = {
-        CHARGE_MODE_CHARGING,
-        CHARGE_MODE_DOCK_CHARGING,
-        CHARGE_MODE_DIRECT_CHARGING,
-        CHARGE_MODE_CHARGE_DONE,
-    }
+    CLEANING_STATES = frozenset(
+        {
+            DIRECTION_CONTROL,
+            ROBOT_PLANNING_RECT,
+            RELOCATION,
+            CLEAN_MODE_Z,
+            CLEAN_MODE_AUTO,
+            CLEAN_MODE_EDGE,
+            CLEAN_MODE_EDGE_DETECT,
+            CLEAN_MODE_SPOT,
+            CLEAN_MODE_SINGLE_ROOM,
+            CLEAN_MODE_ROOMS,
+            CLEAN_MODE_MOP,
+            CLEAN_MODE_SMART,
+            CHARGE_MODE_RETURNING,
+        }
+    )
+
+    CHARGING_STATES = frozenset(
+        {
+            CHARGE_MODE_CHARGING,
+            CHARGE_MODE_DOCK_CHARGING,
+            CHARGE_MODE_DIRECT_CHARGING,
+        }
+    )
+
+    DOCKED_STATES = frozenset(
+        {
+            CHARGE_MODE_CHARGING,
+            CHARGE_MODE_DOCK_CHARGING,
+            CHARGE_MODE_DIRECT_CHARGING,
+            CHARGE_MODE_CHARGE_DONE,
+        }
+    )
 
     # Payload attributes
     ASK_STATUS = "working_status"
@@ -453,7 +459,7 @@ class WebackWssCtrl(WebackApi):
     # Payload switches
     VOICE_SWITCH = "voice_switch"
     UNDISTURB_MODE = "undisturb_mode"
-    SWITCH_VALUES = ["on", "off"]
+    SWITCH_VALUES = frozenset({"on", "off"})
 
     """
     WebSocket Weback API controller
@@ -596,7 +602,7 @@ class WebackWssCtrl(WebackApi):
 
             if wss_data["thing_status"] != self.robot_status:
                 _LOGGER.debug("New update from cloud ->> push update")
-                self.robot_status = wss_data["thing_status"]
+                self.set_robot_status(wss_data["thing_status"])
                 self._call_subscriber()
             else:
                 _LOGGER.debug("No update from cloud")
@@ -711,6 +717,10 @@ class WebackWssCtrl(WebackApi):
         }
         await self.publish_wss(payload)
 
+    def set_robot_status(self, status):
+        """Store a new robot status"""
+        self.robot_status = status
+
     def adapt_refresh_time(self, status):
         """Adapt refreshing time depending on robot status"""
         _LOGGER.debug("WebackApi (WSS) adapt for : %s", status)